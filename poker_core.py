@@ -0,0 +1,386 @@
+# poker_core.py
+# Hand ids, precomputed strength/action tables and scenario generation used by
+# the trainer GUI (main.py). Kept free of Tk so batch tools can import it anywhere.
+
+import random
+from enum import IntEnum
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the batch helpers.
+    np = None
+
+# Random generator shared by the trainer (seed it for reproducible sessions). Its bound
+# methods are looked up once here rather than through the random module on every call.
+rng = random.Random()
+_randrange = rng.randrange
+_randint = rng.randint
+_random = rng.random
+_choices = rng.choices
+
+# ====================================================
+# Global Thresholds (toy numbers – adjust as needed)
+# ====================================================
+# For SB (player in Small Blind)
+SB_RAISE_THRESHOLD = 0.70   # If hand strength ≥0.70, optimal action is raise.
+SB_CALL_THRESHOLD  = 0.40   # If hand strength is between 0.40 and 0.70, optimal is call.
+                           # Otherwise, fold.
+# For BB scenarios:
+BB_ALLIN_THRESHOLD = 0.55   # Against an all‑in SB, call if hand strength ≥0.55; else, fold.
+BB_LIMP_THRESHOLD  = 0.60   # Against an SB limp, raise if hand strength ≥0.60; else, check.
+BB_RAISE_THRESHOLD = 0.50   # Against an SB raise to 2bb, call if hand strength ≥0.50; else, fold.
+
+# ====================================================
+# Helper Functions for Poker Logic
+# ====================================================
+
+# Ranks in descending order (highest first)
+RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
+
+# Map each rank to a numeric value.
+RANK_VALUES = {"A": 14, "K": 13, "Q": 12, "J": 11, "T": 10,
+               "9": 9, "8": 8, "7": 7, "6": 6, "5": 5, "4": 4, "3": 3, "2": 2}
+
+def generate_random_hand():
+    """
+    Generates a random Texas Hold'em starting hand as a hand id (see STARTING_HANDS).
+    Use hand_to_string to display it, e.g. "Q3s".
+    """
+    return DEALS[_randrange(338)]
+
+def generate_random_hands(n):
+    """
+    Generates a list of n random starting hands (as from generate_random_hand)
+    with a single choices() call, for offline analysis and benchmarks.
+    The GUI deals one hand at a time with generate_random_hand.
+    """
+    return _choices(DEALS, k=n)
+
+def compute_hand_strength(hand):
+    """
+    Evaluates a 2-card hold'em hand string (e.g., 'AA', '44', 'QJs', 'A2o')
+    and returns a float between 0.0 and 1.0 indicating approximate strength.
+    Used at import to build HAND_STRENGTH; call evaluate_hand_strength instead.
+    
+    Hand format assumptions:
+      - Pocket pairs: 'AA', 'KK', '22', etc. (2 characters total)
+      - Non-pairs: 'QJs', 'T9o', 'A2o', etc. (3 characters total, with 's' or 'o')
+      
+    This version uses a connectivity bonus that is computed as:
+      connectivity_bonus = connectivity_coefficient * simulated_straight_probability(gap)
+    rather than simply adding a fixed bonus.
+    """
+    # --- 1) Pocket Pairs ---
+    if len(hand) == 2:
+        # For pocket pairs like 'AA', '44', etc.
+        value = RANK_VALUES[hand[0]]
+        # Create a curved scale so that even 22 gets a decent value and AA = 1.0.
+        strength = 0.3 + 0.7 * ((value - 2) / (14 - 2))
+        return min(max(strength, 0.0), 1.0)
+    
+    # --- 2) Non-pairs (e.g., 'QJs', 'T9o', 'A2o', etc.) ---
+    elif len(hand) == 3:
+        card1, card2, suit_char = hand[0], hand[1], hand[2]
+        v1, v2 = RANK_VALUES[card1], RANK_VALUES[card2]
+        
+        # Ensure v1 is the higher value.
+        if v2 > v1:
+            v1, v2 = v2, v1
+        
+        # Base strength from average rank.
+        # For example, for AQ => (14 + 12) / 28 ≈ 0.93 (before bonuses).
+        base = (v1 + v2) / 28.0
+        
+        # --- 2a) Suited Bonus ---
+        suited_bonus = 0.05 if suit_char == 's' else 0.0
+        
+        # --- 2b) Connectivity Bonus (via simulated straight probability) ---
+        gap = v1 - v2
+        
+        # Lookup table for the (simulated) probability of making a straight at the river,
+        # based on the gap between the two hole cards.
+        # (These numbers come from your simulation results; note that the numbers will depend on the actual cards.)
+        # For example, from your simulation:
+        #   - For gap = 1: hands like T9o have ~0.094 probability (we round to 0.09 here).
+        #   - For gap = 2: ~0.08
+        #   - For gap = 3: ~0.065
+        #   - For gap = 4: ~0.052
+        straight_prob_by_gap = {
+            1: 0.09,
+            2: 0.08,
+            3: 0.065,
+            4: 0.052
+            # For gaps larger than 4, we assume connectivity is minimal.
+        }
+        base_connect_prob = straight_prob_by_gap.get(gap, 0.0)
+        
+        # Multiply the simulated straight probability by a coefficient to moderate its impact.
+        connectivity_coefficient = 0.5  # Adjust this coefficient to change the weight of connectivity.
+        connect_bonus = connectivity_coefficient * base_connect_prob
+        
+        # Combine all components.
+        strength = base + suited_bonus + connect_bonus
+        
+        # Optionally, penalize a very weak kicker when paired with a high card.
+        if v1 >= 11 and v2 <= 5:  # e.g., A4o, K5o.
+            strength -= 0.02
+        
+        # Clamp the strength to [0, 1].
+        return min(max(strength, 0.0), 1.0)
+    
+    # Fallback (should not occur).
+    return 0.0
+
+# ====================================================
+# Precomputed Lookup Tables
+# ====================================================
+# There are only 169 distinct starting hands, so strengths and optimal actions
+# are computed once at import and looked up afterwards. Note that the tables
+# capture the thresholds at import time.
+
+# All starting hands: 13 pocket pairs, then 78 suited and 78 offsuit combos.
+# A hand's position in this list is its hand id (pairs 0-12, suited 13-90,
+# offsuit 91-168), which is how hands are passed around and index the tables.
+STARTING_HANDS = (
+    [r * 2 for r in RANKS]
+    + [r1 + r2 + "s" for i, r1 in enumerate(RANKS) for r2 in RANKS[i+1:]]
+    + [r1 + r2 + "o" for i, r1 in enumerate(RANKS) for r2 in RANKS[i+1:]]
+)
+
+# Hand string -> hand id, e.g. HAND_IDS["AKs"].
+HAND_IDS = {hand: i for i, hand in enumerate(STARTING_HANDS)}
+
+# (rank1 * 13 + rank2) * 2 + suited -> hand id, or -1 for keys no starting hand maps
+# to, where rank1 and rank2 are the higher and lower card's rank number (2 = 0 ... A = 12).
+ID_BY_KEY = [-1] * (13 * 13 * 2)
+for _hand_id, _hand in enumerate(STARTING_HANDS):
+    _r1, _r2 = RANK_VALUES[_hand[0]] - 2, RANK_VALUES[_hand[1]] - 2
+    ID_BY_KEY[(_r1 * 13 + _r2) * 2 + _hand.endswith("s")] = _hand_id
+ID_BY_KEY = tuple(ID_BY_KEY)
+
+# Every outcome of the draw in generate_random_hand (two positions in RANKS and a
+# suited flag, 13 * 13 * 2 outcomes) mapped to its hand id, with the higher card
+# first, so dealing a hand is a single index with no compares or swaps.
+DEALS = []
+for _bits in range(13 * 13 * 2):
+    _i1, _i2 = divmod(_bits >> 1, 13)
+    _hi, _lo = min(_i1, _i2), max(_i1, _i2)
+    if _hi == _lo:
+        DEALS.append(HAND_IDS[RANKS[_hi] * 2])  # e.g., "AA"
+    else:
+        DEALS.append(HAND_IDS[RANKS[_hi] + RANKS[_lo] + ("s" if _bits & 1 else "o")])
+DEALS = tuple(DEALS)
+
+def hand_to_string(hand):
+    """Returns the display string of a hand id, e.g. 'AA', 'QJs' or 'A2o'."""
+    return STARTING_HANDS[hand]
+
+class Scenario(IntEnum):
+    """Decision scenarios; the values double as table indices."""
+    SB = 0           # Player is in the Small Blind.
+    BB_SB_ALLIN = 1  # Player is BB, and SB went all‑in.
+    BB_SB_LIMP = 2   # Player is BB, and SB limped.
+    BB_SB_RAISE = 3  # Player is BB, and SB raised to 2bb.
+
+class Action(IntEnum):
+    """Player actions; the values double as table entries."""
+    FOLD = 0
+    CALL = 1
+    RAISE = 2
+    CHECK = 3
+
+# Scenarios where the player can only fold or call.
+FOLD_CALL_SCENARIOS = frozenset({Scenario.BB_SB_ALLIN, Scenario.BB_SB_RAISE})
+
+def compute_correct_action(strength, scenario, short_stack):
+    """
+    Applies the thresholds to a hand strength and returns the optimal Action.
+    Used at import to build ACTION_TABLE; call decide_correct_action instead.
+    """
+    if scenario == Scenario.SB:
+        if short_stack:
+            return Action.RAISE  # When short-stacked as SB, always push all‑in.
+        elif strength >= SB_RAISE_THRESHOLD:
+            return Action.RAISE
+        elif strength >= SB_CALL_THRESHOLD:
+            return Action.CALL
+        else:
+            return Action.FOLD
+    elif scenario == Scenario.BB_SB_ALLIN:
+        return Action.CALL if strength >= BB_ALLIN_THRESHOLD else Action.FOLD
+    elif scenario == Scenario.BB_SB_LIMP:
+        return Action.RAISE if strength >= BB_LIMP_THRESHOLD else Action.CHECK
+    elif scenario == Scenario.BB_SB_RAISE:
+        return Action.CALL if strength >= BB_RAISE_THRESHOLD else Action.FOLD
+    else:
+        return Action.FOLD
+
+# Hand string -> strength, e.g. HAND_STRENGTH["AKs"].
+HAND_STRENGTH = {hand: compute_hand_strength(hand) for hand in STARTING_HANDS}
+
+# Hand id -> strength.
+STRENGTH_TABLE = tuple(HAND_STRENGTH[hand] for hand in STARTING_HANDS)
+
+# Optimal Actions laid out flat, indexed by
+# (hand id * len(Scenario) + scenario) * 2 + short_stack.
+ACTION_TABLE = tuple(
+    compute_correct_action(strength, scenario, short_stack)
+    for strength in STRENGTH_TABLE
+    for scenario in Scenario
+    for short_stack in (0, 1)
+)
+
+def evaluate_hand_strength(hand):
+    """
+    Returns the precomputed strength (0.0 to 1.0) of a hand id
+    (as returned by generate_random_hand). See compute_hand_strength for the formula.
+    """
+    return STRENGTH_TABLE[hand]
+
+def decide_correct_action(hand, scenario, player_stack=None):
+    """
+    Determines the optimal Action based on the hand strength, Scenario, and (if applicable) player stack.
+    
+    Scenarios:
+      - SB: Player is in the Small Blind.
+          * If player_stack ≤ 15, always push (raise).
+          * Otherwise, if hand strength ≥0.70: raise; if ≥0.40: call; else: fold.
+          
+      - BB_SB_ALLIN: (Player is BB, and SB went all‑in)
+          * Options: Call or Fold. Call if hand strength ≥BB_ALLIN_THRESHOLD; else, fold.
+          
+      - BB_SB_LIMP: (Player is BB, and SB limped)
+          * Options: Check or Raise. Raise if hand strength ≥BB_LIMP_THRESHOLD; else, check.
+          
+      - BB_SB_RAISE: (Player is BB, and SB raised to 2bb)
+          * Options: Call or Fold. Call if hand strength ≥BB_RAISE_THRESHOLD; else, fold.
+    
+    The answer is a single ACTION_TABLE lookup (see compute_correct_action).
+    """
+    short_stack = 1 if player_stack is not None and player_stack <= 15 else 0
+    return ACTION_TABLE[(hand * len(Scenario) + scenario) * 2 + short_stack]
+
+# SB action for a deep SB, indexed by a uniform draw in [0, 100):
+# 20% all-in, 40% limp, 40% raise.
+SB_ACTION_TABLE = (
+    (Scenario.BB_SB_ALLIN,) * 20
+    + (Scenario.BB_SB_LIMP,) * 40
+    + (Scenario.BB_SB_RAISE,) * 40
+)
+
+def simulate_SB_action_for_BB():
+    """
+    Simulates the SB’s action (when player is BB) and returns:
+      - The Scenario (one of BB_SB_ALLIN, BB_SB_LIMP, or BB_SB_RAISE)
+      - The SB’s stack (an integer between 5 and 50).
+    
+    Rules:
+      - If SB’s stack ≤15: SB must go all‑in.
+      - If SB’s stack ≥15:
+          * With probability 0.2, SB goes all‑in.
+          * Otherwise, randomly choose between SB limping and SB raising to 2bb
+            (we use equal weight for these two).
+    """
+    sb_stack = _randint(5, 50)
+    if sb_stack <= 15:
+        return Scenario.BB_SB_ALLIN, sb_stack
+    return SB_ACTION_TABLE[_randrange(100)], sb_stack
+
+def draw_scenario():
+    """
+    Draws one random scenario and returns (hand, scenario, player_stack, opponent_stack).
+    
+    - The player is SB or BB with equal probability; their stack is random between 5 and 50.
+    - As SB, the opponent's (BB) stack is random between 5 and 50.
+    - As BB, the SB's stack and action come from simulate_SB_action_for_BB.
+    """
+    hand = generate_random_hand()
+    player_stack = _randint(5, 50)
+    if _random() < 0.5:
+        return hand, Scenario.SB, player_stack, _randint(5, 50)
+    scenario, sb_stack = simulate_SB_action_for_BB()
+    return hand, scenario, player_stack, sb_stack
+
+def draw_scenarios(n):
+    """
+    Returns a list of n scenarios in the same form as draw_scenario. With NumPy they
+    come from one vectorized generate_scenarios call (seeded from rng, so seeding rng
+    still reproduces a session); without it they are drawn one at a time.
+    """
+    if np is None:
+        return [draw_scenario() for _ in range(n)]
+    hands, _, scenarios, _, player_stacks, opponent_stacks = \
+        generate_scenarios(n, seed=rng.getrandbits(64))
+    scenario_by_value = tuple(Scenario)
+    return [
+        (hand, scenario_by_value[scenario], player_stack, opponent_stack)
+        for hand, scenario, player_stack, opponent_stack in zip(
+            hands.tolist(), scenarios.tolist(), player_stacks.tolist(), opponent_stacks.tolist())
+    ]
+
+# ====================================================
+# Batch Scenario Generation (NumPy)
+# ====================================================
+# For self-play or threshold calibration, generating scenarios one at a time goes
+# through the interpreter for every hand. generate_scenarios does the same work
+# for n scenarios at once with vectorized NumPy operations.
+
+def generate_scenarios(n, seed=None):
+    """
+    Generates n random scenarios at once, following the same rules as
+    draw_scenario and simulate_SB_action_for_BB.
+    
+    Returns a tuple of NumPy arrays, each of length n:
+      - hand ids (see STARTING_HANDS)
+      - hand strengths
+      - Scenario values
+      - optimal Action values (see ACTION_TABLE)
+      - player stacks
+      - opponent stacks
+    """
+    if np is None:
+        raise ImportError("generate_scenarios requires NumPy")
+    gen = np.random.default_rng(seed)
+    
+    # Hands: two ranks (2 = 0 ... A = 12), higher first; pairs are never suited.
+    ranks = gen.integers(0, 13, size=(n, 2))
+    hi = ranks.max(axis=1)
+    lo = ranks.min(axis=1)
+    suited = (gen.random(n) < 0.5) & (hi != lo)
+    hands = np.asarray(ID_BY_KEY)[(hi * 13 + lo) * 2 + suited]
+    strengths = np.asarray(STRENGTH_TABLE)[hands]
+    
+    # Stacks and scenarios.
+    player_stacks = gen.integers(5, 51, size=n)
+    opponent_stacks = gen.integers(5, 51, size=n)
+    is_sb = gen.random(n) < 0.5
+    r = gen.random(n)
+    bb_scenarios = np.where((opponent_stacks <= 15) | (r < 0.2), Scenario.BB_SB_ALLIN,
+                            np.where(r < 0.2 + 0.4, Scenario.BB_SB_LIMP, Scenario.BB_SB_RAISE))
+    scenarios = np.where(is_sb, Scenario.SB, bb_scenarios)
+    
+    # Optimal actions straight from the precomputed table.
+    short_stacks = player_stacks <= 15
+    actions = np.asarray(ACTION_TABLE)[(hands * len(Scenario) + scenarios) * 2 + short_stacks]
+    
+    return hands, strengths, scenarios, actions, player_stacks, opponent_stacks
+
+def evaluate_hand_strengths_batch(v1s, v2s, suited):
+    """
+    Vectorized evaluate_hand_strength for arrays of rank values (2-14, as in RANK_VALUES,
+    either order) and suited flags; returns a NumPy array of strengths.
+    
+    There are only 169 distinct inputs, so this gathers from STRENGTH_TABLE rather than
+    evaluating the formula per element.
+    """
+    if np is None:
+        raise ImportError("evaluate_hand_strengths_batch requires NumPy")
+    v1s = np.asarray(v1s)
+    v2s = np.asarray(v2s)
+    if ((v1s < 2) | (v1s > 14) | (v2s < 2) | (v2s > 14)).any():
+        raise ValueError("rank values must be between 2 and 14")
+    hi = np.maximum(v1s, v2s) - 2
+    lo = np.minimum(v1s, v2s) - 2
+    suited = np.asarray(suited, dtype=bool) & (hi != lo)
+    hands = np.asarray(ID_BY_KEY)[(hi * 13 + lo) * 2 + suited]
+    return np.asarray(STRENGTH_TABLE)[hands]
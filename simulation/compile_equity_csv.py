@@ -1,62 +1,87 @@
 import os
-import glob
+import re
+import mmap
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
 # Set the directory where your simulation results are stored.
 # For example, if this script is in the same folder as the "equity_simulation_results" folder:
 this_dir = os.path.dirname(os.path.abspath(__file__))
 results_dir = os.path.join(this_dir, "equity_simulation_results")
 
-# Find all files matching the pattern "equity_results_*.txt" in the results directory.
-file_pattern = os.path.join(results_dir, "equity_results_*.txt")
-file_list = glob.glob(file_pattern)
+# Files are named like "equity_results_AKo.txt" or "equity_results_22.txt".
+prefix = "equity_results_"
+suffix = ".txt"
+
+# Matches a line like: "Average Equity: 0.502026"
+equity_pattern = re.compile(rb"^Average Equity:\s*([0-9.]+)", re.M)
+
+# Ranks in the canonical descending order used by the equity matrix.
+RANKS = "AKQJT98765432"
+
+# Files larger than this are searched through mmap instead of being read in.
+MMAP_THRESHOLD = 1 << 20
+
+
+def hand_columns(hand):
+    """
+    Returns the (r1, r2, type) columns for a hand string: the rank indices of its
+    first and second card in RANKS, and "pair", "suited" or "offsuit". Returns None
+    if the string is not a hand.
+    """
+    if len(hand) not in (2, 3) or hand[0] not in RANKS or hand[1] not in RANKS:
+        return None
+    if len(hand) == 2:
+        hand_type = "pair"
+    elif hand[2] == "s":
+        hand_type = "suited"
+    elif hand[2] == "o":
+        hand_type = "offsuit"
+    else:
+        return None
+    return RANKS.index(hand[0]), RANKS.index(hand[1]), hand_type
 
-# List to hold tuples of (hand, average_equity)
-results = []
 
-# Process each file.
-for file_path in file_list:
-    filename = os.path.basename(file_path)
-    # Extract the hand string.
-    # Files are named like "equity_results_AKo.txt" or "equity_results_22.txt".
-    # We extract the portion between "equity_results_" and ".txt".
-    prefix = "equity_results_"
-    suffix = ".txt"
+def read_average_equity(file_path):
+    """Returns the average equity recorded in a results file, or None."""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                m = equity_pattern.search(data)
+        else:
+            m = equity_pattern.search(f.read())
+    return m.group(1).decode() if m else None
+
+
+# Collect the result files in the results directory.
+with os.scandir(results_dir) as entries:
+    result_files = [
+        (entry.name, entry.path) for entry in entries
+        if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+    ]
+
+# Parsing is I/O bound, so read the files on a small thread pool.
+with ThreadPoolExecutor() as pool:
+    equities = list(pool.map(read_average_equity, [path for _, path in result_files]))
+
+# List to hold tuples of (hand, average_equity, r1, r2, type)
+results = []
+for (filename, _), avg_equity in zip(result_files, equities):
+    # Extract the portion between "equity_results_" and ".txt".
     hand = filename[len(prefix):-len(suffix)]
-    
-    # Open and read the file.
-    with open(file_path, "r") as f:
-        lines = f.readlines()
-    
-    avg_equity = None
-    # Look for the line that starts with "Average Equity:"
-    for line in lines:
-        if line.strip().startswith("Average Equity:"):
-            # Expecting a line like: "Average Equity: 0.502026"
-            try:
-                parts = line.strip().split(":")
-                if len(parts) >= 2:
-                    avg_equity = parts[1].strip()
-                    break
-            except Exception as e:
-                print(f"Error processing line in {filename}: {e}")
-    
-    if avg_equity is not None:
-        results.append((hand, avg_equity))
+    columns = hand_columns(hand)
+    if columns is None:
+        print(f"Warning: Skipping {filename}, {hand!r} is not a hand")
+    elif avg_equity is not None:
+        results.append((hand, avg_equity, *columns))
     else:
         print(f"Warning: Could not find average equity in file {filename}")
 
-# Optionally sort the results by hand for clarity.
-results.sort(key=lambda x: x[0])
-
-# Write the results to a CSV file in the same directory.
+# Write the results, sorted by hand, to a CSV file in the same directory.
 csv_file = os.path.join(results_dir, "equity_summary.csv")
-with open(csv_file, "w", newline="") as csvfile:
+with open(csv_file, "w", newline="", buffering=1 << 16) as csvfile:
     csvwriter = csv.writer(csvfile)
-    # Write header row.
-    csvwriter.writerow(["Hand", "Average Equity"])
-    # Write each result.
-    for hand, equity in results:
-        csvwriter.writerow([hand, equity])
+    csvwriter.writerow(["Hand", "Average Equity", "r1", "r2", "type"])
+    csvwriter.writerows(sorted(results))
 
 print("CSV summary written to:", csv_file)
@@ -1,6 +1,12 @@
-import random
+import functools
 import itertools
 import os
+from multiprocessing import Pool
+
+import numpy as np
+
+# Generator EquitySimulator deals from unless it is given one.
+_RNG = np.random.default_rng()
 
 # -------------------------------
 # Helper Functions for Card and Deck Management
@@ -9,45 +15,57 @@ import os
 RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
 SUITS = ["h", "d", "c", "s"]
 
-# Map ranks to numeric values for evaluation.
-RANK_VALUES = {"A": 14, "K": 13, "Q": 12, "J": 11, "T": 10,
-               "9": 9, "8": 8, "7": 7, "6": 6, "5": 5, "4": 4, "3": 3, "2": 2}
+# Cards are ints 0-51: rank index * 4 + suit index, where the rank index runs from
+# 0 ("2") to 12 ("A") and the suit index follows SUITS. Rank value = rank index + 2.
+def card_code(rank, suit):
+    """Returns the code of the card with rank and suit characters, e.g. ("A", "h")."""
+    return (12 - RANKS.index(rank)) * 4 + SUITS.index(suit)
 
-def build_deck(exclude_cards=None):
-    """Build a 52-card deck as a list of (rank, suit) tuples, excluding any cards in exclude_cards."""
-    deck = [(r, s) for r in RANKS for s in SUITS]
-    if exclude_cards:
-        deck = [card for card in deck if card not in exclude_cards]
-    return deck
+# The full deck as card codes, shared by every simulator (see hero_deck).
+DECK52 = np.arange(52, dtype=np.int8)
 
+@functools.lru_cache(maxsize=None)
 def parse_hand(hand_str):
     """
-    Converts a hand string into two card tuples.
+    Converts a hand string into a tuple of two card codes.
     Format assumptions:
       - Pocket pairs: "AA", "44", etc. (we assign different suits, e.g., ("A","h"), ("A","d"))
       - Non-pairs: e.g., "Q7o" or "Q7s".
           * For suited, assign both cards the same suit (here "h").
           * For offsuit, assign different suits (here "h" and "d").
+    Suits are interchangeable preflop, so this one canonical deal stands for every
+    suit permutation of the hand.
     """
     if len(hand_str) == 2:
-        return [(hand_str[0], "h"), (hand_str[1], "d")]
+        return (card_code(hand_str[0], "h"), card_code(hand_str[1], "d"))
     elif len(hand_str) == 3:
         rank1, rank2, style = hand_str[0], hand_str[1], hand_str[2]
         if style.lower() == "s":
-            return [(rank1, "h"), (rank2, "h")]
+            return (card_code(rank1, "h"), card_code(rank2, "h"))
         else:
-            return [(rank1, "h"), (rank2, "d")]
+            return (card_code(rank1, "h"), card_code(rank2, "d"))
     else:
         raise ValueError("Invalid hand string format.")
 
+@functools.lru_cache(maxsize=None)
+def hero_deck(hero_hand_str):
+    """
+    Returns (hero's card codes, the 50 card codes left in DECK52), computed once per
+    hand string and shared by every simulator for that hand. The deck is read-only.
+    """
+    hero_codes = parse_hand(hero_hand_str)
+    deck50 = DECK52[~np.isin(DECK52, hero_codes)]
+    deck50.flags.writeable = False
+    return hero_codes, deck50
+
 # -------------------------------
-# Simple 5-Card Hand Evaluator
+# Hand Values (card codes)
 # -------------------------------
 
-def evaluate_5card_hand(cards):
+def hand_value(category, *ranks):
     """
-    Given 5 cards (each a tuple (rank, suit)), returns a tuple (category, tiebreaker)
-    where a higher tuple means a stronger hand.
+    Packs a hand category and up to five tiebreaker rank indices (0-12) into one
+    int, 4 bits each, so hands compare as plain ints.
     
     Categories (higher is better):
       9: Straight flush
@@ -59,141 +77,250 @@ def evaluate_5card_hand(cards):
       3: Two pair
       2: One pair
       1: High card
-    
-    The tiebreaker is a tuple of card values in descending order.
     """
-    # Get sorted ranks (numeric) and suits.
-    values = sorted([RANK_VALUES[card[0]] for card in cards], reverse=True)
-    suits = [card[1] for card in cards]
-    
-    # Check for flush.
-    is_flush = len(set(suits)) == 1
+    value = category
+    for rank in ranks:
+        value = (value << 4) | rank
+    return value << (4 * (5 - len(ranks)))
+
+def top_ranks(mask, n):
+    """Returns the n highest rank indices set in a 13-bit rank mask, highest first."""
+    ranks = []
+    while mask and len(ranks) < n:
+        rank = mask.bit_length() - 1
+        ranks.append(rank)
+        mask ^= 1 << rank
+    return ranks
+
+def straight_high(mask):
+    """
+    Returns the rank index of the highest straight in a 13-bit rank mask, or -1 if none.
+    The mask is shifted up one bit and the Ace copied into bit 0, so A-2-3-4-5 is an
+    ordinary run of five bits; a run starting at bit i is a straight to rank index i + 3.
+    """
+    m = (mask << 1) | (mask >> 12)
+    runs = m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)
+    return runs.bit_length() + 2 if runs else -1
+
+def flush_value(mask):
+    """Returns the value of the best flush (or straight flush) in one suit's rank mask."""
+    high = straight_high(mask)
+    if high >= 0:
+        return hand_value(9, high)  # Straight flush.
+    return hand_value(6, *top_ranks(mask, 5))
+
+def counts_value(counts, rank_mask):
+    """
+    Returns the value of the best non-flush hand given a rank histogram and the mask
+    of ranks present.
+    """
+    quads, trips, pairs = [], [], []
+    for rank in range(12, -1, -1):
+        count = counts[rank]
+        if count == 4:
+            quads.append(rank)
+        elif count == 3:
+            trips.append(rank)
+        elif count == 2:
+            pairs.append(rank)
     
-    # For straights, account for Ace as low.
-    sorted_vals = sorted(set(values))
-    is_straight = False
-    straight_high = None
-    # Check normal straight:
-    if len(sorted_vals) >= 5:
-        for i in range(len(sorted_vals) - 4):
-            if sorted_vals[i+4] - sorted_vals[i] == 4:
-                is_straight = True
-                straight_high = sorted_vals[i+4]
-    # Check Ace-low straight (A, 2, 3, 4, 5)
-    if not is_straight and set([14, 2, 3, 4, 5]).issubset(set(values)):
-        is_straight = True
-        straight_high = 5
-
-    # Count duplicates.
-    counts = {}
-    for v in values:
-        counts[v] = counts.get(v, 0) + 1
-    counts_items = sorted(counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
-    # counts_items is list of (value, count) sorted by count then value.
+    if quads:
+        quad = quads[0]
+        return hand_value(8, quad, *top_ranks(rank_mask & ~(1 << quad), 1))
+    if trips and (len(trips) > 1 or pairs):
+        # Full house: the pair is the better of a second set of trips and the top pair.
+        return hand_value(7, trips[0], max(trips[1:] + pairs[:1]))
+    high = straight_high(rank_mask)
+    if high >= 0:
+        return hand_value(5, high)
+    if trips:
+        triple = trips[0]
+        return hand_value(4, triple, *top_ranks(rank_mask & ~(1 << triple), 2))
+    if len(pairs) >= 2:
+        pair1, pair2 = pairs[0], pairs[1]
+        return hand_value(3, pair1, pair2, *top_ranks(rank_mask & ~(1 << pair1) & ~(1 << pair2), 1))
+    if pairs:
+        pair = pairs[0]
+        return hand_value(2, pair, *top_ranks(rank_mask & ~(1 << pair), 3))
+    return hand_value(1, *top_ranks(rank_mask, 5))
+
+# -------------------------------
+# 7-Card Lookup Tables (vectorized)
+# -------------------------------
+
+# A hand's ranks are keyed by the sum of 5 ** rank index over its cards: no rank
+# appears more than 4 times, so the key is a base-5 number with one digit per rank.
+RANK_WEIGHTS = 5 ** np.arange(13, dtype=np.int64)
+RANK_BITS = 1 << np.arange(13, dtype=np.int64)
+
+@functools.lru_cache(maxsize=None)
+def lookup_tables():
+    """
+    Builds the tables evaluate7_batch looks hands up in, once per process (a fraction
+    of a second), returning (rank_keys, rank_values, flush_values):
+      - rank_keys: the keys of all 49205 possible 7-card rank multisets, sorted.
+      - rank_values: the value of the best non-flush hand for each of those keys.
+      - flush_values: for each 13-bit rank mask of one suit, the value of the best
+        flush or straight flush in it, or 0 when it holds fewer than 5 cards.
+    """
+    keys = []
+    values = []
+    for ranks in itertools.combinations_with_replacement(range(13), 7):
+        counts = [0] * 13
+        rank_mask = 0
+        for rank in ranks:
+            counts[rank] += 1
+            rank_mask |= 1 << rank
+        if max(counts) > 4:
+            continue
+        keys.append(sum(5 ** rank for rank in ranks))
+        values.append(counts_value(counts, rank_mask))
+    order = np.argsort(keys)
+    rank_keys = np.array(keys, dtype=np.int64)[order]
+    rank_values = np.array(values, dtype=np.int64)[order]
     
-    # Determine hand category.
-    if is_straight and is_flush:
-        return (9, (straight_high,))  # Straight flush.
-    elif counts_items[0][1] == 4:
-        # Four of a kind.
-        quad = counts_items[0][0]
-        kicker = max([v for v in values if v != quad])
-        return (8, (quad, kicker))
-    elif counts_items[0][1] == 3 and counts_items[1][1] >= 2:
-        # Full house.
-        triple = counts_items[0][0]
-        pair = counts_items[1][0]
-        return (7, (triple, pair))
-    elif is_flush:
-        return (6, tuple(sorted(values, reverse=True)))
-    elif is_straight:
-        return (5, (straight_high,))
-    elif counts_items[0][1] == 3:
-        # Three of a kind.
-        triple = counts_items[0][0]
-        kickers = sorted([v for v in values if v != triple], reverse=True)
-        return (4, (triple,) + tuple(kickers))
-    elif counts_items[0][1] == 2 and counts_items[1][1] == 2:
-        # Two pair.
-        pair1 = counts_items[0][0]
-        pair2 = counts_items[1][0]
-        kicker = max([v for v in values if v != pair1 and v != pair2])
-        return (3, (pair1, pair2, kicker))
-    elif counts_items[0][1] == 2:
-        # One pair.
-        pair = counts_items[0][0]
-        kickers = sorted([v for v in values if v != pair], reverse=True)
-        return (2, (pair,) + tuple(kickers))
-    else:
-        return (1, tuple(values))
+    flush_values = np.zeros(1 << 13, dtype=np.int64)
+    for mask in range(1 << 13):
+        if mask.bit_count() >= 5:
+            flush_values[mask] = flush_value(mask)
+    return rank_keys, rank_values, flush_values
+
+def board_state_batch(boards):
+    """
+    Given an (N, 5) array of board card codes, returns each board's rank key and its
+    four per-suit rank masks, as ((N,) keys, (N, 4) masks): the part of the evaluation
+    that hero and opponent share. See finish_batch.
+    """
+    ranks = boards >> 2
+    suits = boards & 3
+    bits = RANK_BITS[ranks]
+    keys = RANK_WEIGHTS[ranks].sum(axis=-1)
+    masks = np.stack([np.where(suits == suit, bits, 0).sum(axis=-1) for suit in range(4)], axis=-1)
+    return keys, masks
 
-def best_hand_value(seven_cards):
+def finish_batch(state, hole_cards):
     """
-    Given 7 cards, returns the best 5-card hand value (as returned by evaluate_5card_hand).
+    Adds hole cards, an (N, 2) array or one pair shared by every row, to a
+    board_state_batch and returns the (N,) values of the best 5-card hands (see
+    hand_value); a higher value means a stronger hand.
+    The rank multiset and the suit masks are each looked up in lookup_tables, and a
+    flush, when there is one, outranks anything the ranks alone make.
     """
-    best = (0, ())
-    for combo in itertools.combinations(seven_cards, 5):
-        value = evaluate_5card_hand(combo)
-        if value > best:
-            best = value
-    return best
+    rank_keys, rank_values, flush_values = lookup_tables()
+    hole_state = board_state_batch(np.asarray(hole_cards))
+    keys = state[0] + hole_state[0]
+    # A suit never holds the same rank twice, so adding the masks is the same as OR-ing them.
+    masks = state[1] + hole_state[1]
+    values = rank_values[np.searchsorted(rank_keys, keys)]
+    return np.maximum(values, flush_values[masks].max(axis=-1))
+
+def evaluate7_batch(cards):
+    """Returns the hand values (see hand_value) of an (N, 7) array of card codes."""
+    cards = np.asarray(cards)
+    return finish_batch(board_state_batch(cards[:, 2:]), cards[:, :2])
 
 # -------------------------------
 # Equity Simulator
 # -------------------------------
 
+# Per-trial outcome codes, chosen so that a trial's equity is its code / 2.
+LOSS, TIE, WIN = 0, 1, 2
+
+# Trials are dealt this many at a time, so a batch's random draws take about 10 MB
+# (50k rows of 50 float32s) however many trials it asks for.
+CHUNK_SIZE = 50_000
+
+def run_trials(hero_codes, deck, simulations, rng):
+    """
+    Deals and scores `simulations` trials of hero_codes against a random opponent hand,
+    drawing from deck (the card codes not in hero's hand) with the Generator rng.
+    Returns an int8 array with each trial's outcome (LOSS, TIE or WIN).
+    """
+    # The 7 smallest of 50 uniform draws pick 7 distinct cards per trial. Partitioning
+    # at 1 and 6 keeps the opponent's 2 cards (the two smallest draws) ahead of the board.
+    # The draws are by far the largest array here (50 per trial against 7 int8 card
+    # codes), so they are float32: half the memory traffic, and ties between draws stay
+    # rare enough (about 1 trial in 10^4) to be lost in the sampling noise.
+    rand = rng.random((simulations, len(deck)), dtype=np.float32)
+    deals = deck[np.argpartition(rand, (1, 6), axis=1)[:, :7]]
+    
+    # Build the boards' rank keys and suit masks once for both players.
+    board = board_state_batch(deals[:, 2:])
+    
+    hero_values = finish_batch(board, hero_codes)
+    opp_values = finish_batch(board, deals[:, :2])
+    
+    # WIN = 2 counts both comparisons, TIE = 1 only the second, LOSS = 0 neither.
+    return (hero_values > opp_values).astype(np.int8) + (hero_values >= opp_values)
+
 class EquitySimulator:
-    def __init__(self, hero_hand_str, simulations=10000):
+    def __init__(self, hero_hand_str, simulations=10000, rng=None, pool=None):
         """
-        Initialize with hero's hand (e.g., "Q7o") and number of simulations.
+        Initialize with hero's hand (e.g., "Q7o"), number of simulations, and optionally
+        the NumPy Generator to deal with (_RNG by default) and a multiprocessing Pool to
+        split the trials across. The caller owns the pool, e.g.:
+        
+            with Pool() as pool:
+                equity = EquitySimulator("AKs", 1_000_000, pool=pool).simulate()
         """
         self.hero_hand_str = hero_hand_str
         self.simulations = simulations
-        self.hero_cards = parse_hand(hero_hand_str)
+        self.rng = _RNG if rng is None else rng
+        self.pool = pool
+        # Hero's card codes and the 50 cards every trial deals from, shared per hand.
+        self.hero_codes, self.deck50 = hero_deck(hero_hand_str)
     
     def simulate(self):
         """
         Run simulations to determine the equity of the hero's hand versus a random opponent hand.
         
         Process:
-          - Build a deck, removing hero's cards.
-          - Randomly choose 2 cards for opponent (ensuring no overlap).
-          - Deal 5 board cards.
-          - Compute best 5-card hand for hero and opponent.
+          - Deal the trials from self.deck50 (see simulate_batch): 7 distinct cards per trial,
+            the first 2 to the opponent and the other 5 to the board.
+          - Compute best 5-card hand for hero and opponent (finish_batch).
           - Count win, tie, and loss.
         
         Returns:
           Equity as a float: win fraction + (tie fraction)/2.
         """
-        wins = 0
-        ties = 0
-        losses = 0
-        
-        for _ in range(self.simulations):
-            deck = build_deck(self.hero_cards)
-            # Randomly sample 2 opponent cards.
-            opp_cards = random.sample(deck, 2)
-            # Remove opponent cards from deck.
-            deck = build_deck(self.hero_cards + opp_cards)
-            # Randomly sample 5 board cards.
-            board = random.sample(deck, 5)
-            
-            hero_seven = self.hero_cards + board
-            opp_seven = opp_cards + board
-            
-            hero_value = best_hand_value(hero_seven)
-            opp_value = best_hand_value(opp_seven)
-            
-            if hero_value > opp_value:
-                wins += 1
-            elif hero_value == opp_value:
-                ties += 1
-            else:
-                losses += 1
+        outcomes = self.simulate_batch(self.simulations)
+        # Sum the int8 codes as integers: twice the number of wins plus the number of ties.
+        return int(outcomes.sum(dtype=np.int64)) / (2 * len(outcomes)) if len(outcomes) else 0
+    
+    def simulate_batch(self, n_total):
+        """
+        Runs n_total trials and returns their outcomes as an int8 array of LOSS, TIE
+        and WIN codes, so the caller can split one large batch into runs (the equity of
+        any slice is its mean / 2).
         
-        total = wins + ties + losses
-        equity = (wins + 0.5 * ties) / total if total else 0
-        return equity
+        The trials are dealt CHUNK_SIZE at a time and their outcomes written into one
+        array. With a pool, its workers deal the chunks, each from a generator spawned
+        from self.rng; otherwise they are dealt in this process.
+        """
+        outcomes = np.empty(n_total, dtype=np.int8)
+        if self.pool is not None:
+            starts = range(0, n_total, CHUNK_SIZE)
+            jobs = [(self.hero_codes, self.deck50, min(start + CHUNK_SIZE, n_total) - start, rng)
+                    for start, rng in zip(starts, self.rng.spawn(len(starts)))]
+            for start, chunk in zip(starts, self.pool.starmap(run_trials, jobs)):
+                outcomes[start:start + len(chunk)] = chunk
+            return outcomes
+        for start in range(0, n_total, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, n_total)
+            outcomes[start:stop] = run_trials(self.hero_codes, self.deck50, stop - start, self.rng)
+        return outcomes
+
+def run_one_hand(hand, num_runs=10, sims_per_run=10000):
+    """
+    Simulates one hand as a single batch of num_runs * sims_per_run trials from a fresh
+    generator, split into runs afterwards. Returns (hand, avg_equity, run_results).
+    """
+    simulator = EquitySimulator(hand, simulations=sims_per_run, rng=np.random.default_rng())
+    outcomes = simulator.simulate_batch(num_runs * sims_per_run)
+    run_totals = outcomes.reshape(num_runs, sims_per_run).sum(axis=1, dtype=np.int32)
+    run_results = (run_totals / (2 * sims_per_run)).tolist()
+    avg_equity = sum(run_results) / len(run_results)
+    return hand, avg_equity, run_results
 
 if __name__ == "__main__":
     # Create a folder for simulation results if it doesn't exist.
@@ -209,25 +336,22 @@ if __name__ == "__main__":
     
     results_summary = {}
     
-    for hand in test_hands:
-        run_results = []
-        simulator = EquitySimulator(hand, simulations=sims_per_run)
-        for run in range(num_runs):
-            eq = simulator.simulate()
-            run_results.append(eq)
-        avg_equity = sum(run_results) / len(run_results)
-        results_summary[hand] = {"avg_equity": avg_equity, "run_results": run_results}
-        
-        # Save the results to a text file.
-        output_file = os.path.join(results_dir, f"equity_results_{hand}.txt")
-        with open(output_file, "w") as f:
-            f.write(f"Equity simulation results for {hand} over {num_runs} runs of {sims_per_run} simulations each:\n\n")
-            for i, eq in enumerate(run_results, 1):
-                f.write(f"Run {i}: {eq:.4f}\n")
-            f.write("\n")
-            f.write(f"Average Equity: {avg_equity:.4f}\n")
-        
-        print(f"Results for {hand}: Average Equity: {avg_equity:.4f}")
+    # Simulate the hands in parallel, one per worker.
+    one_hand = functools.partial(run_one_hand, num_runs=num_runs, sims_per_run=sims_per_run)
+    with Pool(min(os.cpu_count() or 1, len(test_hands))) as pool:
+        for hand, avg_equity, run_results in pool.imap_unordered(one_hand, test_hands):
+            results_summary[hand] = {"avg_equity": avg_equity, "run_results": run_results}
+            
+            # Save the results to a text file.
+            output_file = os.path.join(results_dir, f"equity_results_{hand}.txt")
+            with open(output_file, "w") as f:
+                f.write(f"Equity simulation results for {hand} over {num_runs} runs of {sims_per_run} simulations each:\n\n")
+                for i, eq in enumerate(run_results, 1):
+                    f.write(f"Run {i}: {eq:.4f}\n")
+                f.write("\n")
+                f.write(f"Average Equity: {avg_equity:.4f}\n")
+            
+            print(f"Results for {hand}: Average Equity: {avg_equity:.4f}")
     
     # Optionally, here you could build a mapping from hand strings to equity values.
     # You can then use these equity values to inform your pot-odds calculations and further refine your model.
@@ -1,5 +1,16 @@
 import os
-import random
+import sys
+from math import comb
+
+import numpy as np
+
+# One generator for every simulation in this module.
+_RNG = np.random.default_rng()
+
+# Cards are ints 0-51: rank index * 4 + suit index, with the rank index running from
+# 0 ("2") to 12 ("A") and the suit index following SUITS.
+RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
+SUITS = ['h', 'd', 'c', 's']
 
 class FlushSimulator:
     def __init__(self, hand, simulations=10000):
@@ -17,15 +28,17 @@ class FlushSimulator:
         self.suit = hand[-1].lower()  # e.g., 'h' for hearts
 
     def build_deck(self):
-        """Builds a deck of 52 cards as tuples (rank, suit) and removes the cards in self.hand."""
-        suits = ['h', 'd', 'c', 's']
-        ranks = ["A","K","Q","J","T","9","8","7","6","5","4","3","2"]
-        deck = [(r, s) for r in ranks for s in suits]
-        
+        """
+        Builds a deck of 52 card codes (rank index * 4 + suit index, rank index 0 for "2"
+        up to 12 for "A") as an int8 array and removes the cards in self.hand.
+        """
         # Remove the two specific suited cards in our hand.
         # E.g., if self.hand is "AKh", we assume the two cards are ("A","h") and ("K","h").
-        hand_cards = [(self.hand[0], self.suit), (self.hand[1], self.suit)]
-        deck = [card for card in deck if card not in hand_cards]
+        suit = SUITS.index(self.suit)
+        hand_cards = [(12 - RANKS.index(rank)) * 4 + suit for rank in self.hand[:2]]
+        deck = np.array([card for card in range(52) if card not in hand_cards], dtype=np.int8)
+        # Suit of each deck card as an index into SUITS, for the vectorized simulation.
+        self.suit_arr = deck & 3
         return deck
 
     def simulate_flush_probability(self):
@@ -37,30 +50,41 @@ class FlushSimulator:
             float: The estimated flush probability.
         """
         deck = self.build_deck()
-        flush_count = 0
+        target_suit = SUITS.index(self.suit)
         
-        for _ in range(self.simulations):
-            board = random.sample(deck, 5)
-            # Count how many cards on the board match our suit
-            suit_count = sum(1 for card in board if card[1] == self.suit)
-            if suit_count >= 3:
-                flush_count += 1
+        # Deal every board at once: the 5 smallest of len(deck) uniform draws per row
+        # pick 5 distinct deck cards. float32 draws halve the largest array here.
+        rand = _RNG.random((self.simulations, len(deck)), dtype=np.float32)
+        boards = np.argpartition(rand, 4, axis=1)[:, :5]
+        # Count how many cards on each board match our suit
+        suit_counts = (self.suit_arr[boards] == target_suit).sum(axis=1)
+        return float((suit_counts >= 3).mean())
+
+    def exact_flush_probability(self):
+        """
+        Computes the same probability exactly: the number of 5-card boards with at least
+        3 of our suit is a hypergeometric sum, so no simulation is needed.
         
-        return flush_count / self.simulations
+        Returns:
+            float: The exact flush probability.
+        """
+        # Our two cards leave 11 of our suit and 39 other cards in the 50-card deck.
+        ours, others = 13 - 2, 52 - 13
+        boards = sum(comb(ours, k) * comb(others, 5 - k) for k in (3, 4, 5))
+        return boards / comb(ours + others, 5)
 
 if __name__ == "__main__":
-    # We'll run the simulation multiple times and average the results.
     simulator = FlushSimulator("AKh", simulations=10000)
+    exact_probability = simulator.exact_flush_probability()
     
-    num_runs = 25
+    # The Monte Carlo runs only serve to check the exact value; pass --simulate to run them.
+    num_runs = 25 if "--simulate" in sys.argv[1:] else 0
     results = []
     
     for i in range(num_runs):
         probability = simulator.simulate_flush_probability()
         results.append(probability)
     
-    avg_probability = sum(results) / num_runs
-    
     # Create a "simulation" folder next to this file if it doesn't exist
     this_dir = os.path.dirname(os.path.abspath(__file__))
     sim_dir = os.path.join(this_dir)
@@ -69,12 +93,17 @@ if __name__ == "__main__":
     # Write the results to a file in that folder
     output_file = os.path.join(sim_dir, "flush_results.txt")
     with open(output_file, "w") as f:
-        f.write("Flush probability results for AKh (25 runs):\n\n")
-        for i, prob in enumerate(results, 1):
-            f.write(f"Run {i}: {prob:.4f}\n")
-        f.write("\n")
-        f.write(f"Average Probability: {avg_probability:.4f}\n")
+        f.write(f"Flush probability for AKh: {exact_probability:.4f} (exact)\n")
+        if results:
+            avg_probability = sum(results) / num_runs
+            f.write(f"\nSimulation results ({num_runs} runs):\n\n")
+            for i, prob in enumerate(results, 1):
+                f.write(f"Run {i}: {prob:.4f}\n")
+            f.write("\n")
+            f.write(f"Average Probability: {avg_probability:.4f}\n")
     
     # Print to console as well
-    print(f"Individual probabilities: {results}")
-    print(f"Average Flush Probability (AKh) over {num_runs} runs: {avg_probability:.4f}")
+    print(f"Exact Flush Probability (AKh): {exact_probability:.4f}")
+    if results:
+        print(f"Individual probabilities: {results}")
+        print(f"Average Flush Probability (AKh) over {num_runs} runs: {avg_probability:.4f}")
@@ -1,5 +1,7 @@
 # generate_starting_hand_lists.py
 
+import numpy as np
+
 RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
 
 def generate_starting_hand_lists():
@@ -13,18 +15,17 @@ def generate_starting_hand_lists():
            
     This produces the 169 unique hand strings in canonical order.
     """
+    ranks = np.array(RANKS)
+    pairs = np.char.add(ranks, ranks).tolist()
+    # Every r1 + r2 combination at once, with the offsuit and suited versions side by
+    # side along the last axis so that each row reads r1r2o, r1r2s, r1r3o, ...
+    combos = np.char.add(ranks[:, None], ranks[None, :])
+    both = np.stack((np.char.add(combos, "o"), np.char.add(combos, "s")), axis=-1)
+    
     starting_hands = {}
     for i, r1 in enumerate(RANKS):
-        hands = []
-        # Add pocket pair.
-        hands.append(r1 * 2)
-        # For every lower rank (i.e. hands where r1 is highest):
-        for r2 in RANKS[i+1:]:
-            # Offsuit version.
-            hands.append(r1 + r2 + "o")
-            # Suited version.
-            hands.append(r1 + r2 + "s")
-        starting_hands[r1] = hands
+        # Pocket pair first, then every lower rank (the upper triangle of row i).
+        starting_hands[r1] = [pairs[i]] + both[i, i+1:].ravel().tolist()
     return starting_hands
 
 if __name__ == "__main__":
@@ -16,36 +16,21 @@ csv_file = os.path.join(this_dir, "equity_simulation_results", "equity_summary.c
 # Read the CSV file into a DataFrame.
 df = pd.read_csv(csv_file)
 
-# Create a dictionary mapping each hand string (e.g. "AKo", "AKs", "AA", etc.) to its average equity.
-equity_dict = dict(zip(df['Hand'], df['Average Equity']))
-
-# Create an empty 13x13 NumPy array to hold the equity values.
-matrix = np.empty((13, 13), dtype=float)
-matrix[:] = np.nan  # Initialize with NaN
-
-# Fill in the matrix according to the following rule:
-# - For diagonal cells: use the pocket pair (e.g. "AA").
-# - For cells where row index < column index (upper triangle): use the suited version.
-# - For cells where row index > column index (lower triangle): use the offsuited version,
-#   ensuring that the higher card is always first.
-for i, r1 in enumerate(ranks):
-    for j, r2 in enumerate(ranks):
-        if i == j:
-            hand_str = r1 * 2  # e.g., "AA"
-        elif i < j:
-            # For upper triangle, row index < column index.
-            # Because ranks is in descending order, r1 is higher than r2.
-            hand_str = r1 + r2 + "s"
-        else:
-            # For lower triangle, row index > column index.
-            # In this case r1 is lower than r2, so put the higher card (r2) first.
-            hand_str = r2 + r1 + "o"
-        # Look up the average equity; if not found, leave as NaN.
-        equity = equity_dict.get(hand_str, np.nan)
-        matrix[i, j] = equity
-
-# Create a DataFrame from the matrix for easier plotting.
-matrix_df = pd.DataFrame(matrix, index=ranks, columns=ranks)
+# Place each hand in the 13x13 matrix straight from its rank-index columns:
+# - For diagonal cells: the pocket pair (e.g. "AA").
+# - For cells where row index < column index (upper triangle): the suited version,
+#   at (first card, second card).
+# - For cells where row index > column index (lower triangle): the offsuited version,
+#   at (second card, first card), since the higher card is always listed first.
+offsuit = df["type"] == "offsuit"
+df["row"] = np.where(offsuit, df["r2"], df["r1"])
+df["col"] = np.where(offsuit, df["r1"], df["r2"])
+
+# One pivot builds the matrix; hands missing from the CSV are left as NaN.
+matrix_df = (df.pivot(index="row", columns="col", values="Average Equity")
+               .reindex(index=range(13), columns=range(13)))
+matrix_df.index = ranks
+matrix_df.columns = ranks
 
 # Create the heatmap.
 plt.figure(figsize=(10, 8))
@@ -1,87 +1,121 @@
-import random
 import os
+from functools import lru_cache, partial
+from multiprocessing import Pool
+
+import numpy as np
 import matplotlib.pyplot as plt
 
+# Generator simulate_straight_batch deals from unless it is given one.
+_RNG = np.random.default_rng()
+
 # -------------------------------
 # Helper Functions
 # -------------------------------
 
+# Cards are ints 0-51: rank index * 4 + suit index, with the rank index running from
+# 0 ("2") to 12 ("A") and suits in the order h, d, c, s.
+RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
+SUITS = ['h', 'd', 'c', 's']
+
+def card_code(rank, suit):
+    """Returns the code of the card with rank and suit characters, e.g. ("A", "h")."""
+    return (12 - RANKS.index(rank)) * 4 + SUITS.index(suit)
+
 def build_deck(exclude_cards):
     """
-    Build a standard 52-card deck (each card is a tuple (rank, suit))
+    Build a standard 52-card deck (as card codes)
     and remove any cards that are in the exclude_cards list.
     """
-    suits = ['h', 'd', 'c', 's']
-    ranks = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
-    deck = [(r, s) for r in ranks for s in suits]
-    deck = [card for card in deck if card not in exclude_cards]
-    return deck
+    return [card for card in range(52) if card not in exclude_cards]
+
+# Rank index -> bit in a 15-bit rank mask, bit i standing for rank value i (index + 2).
+# The Ace sets both bit 14 (high) and bit 1 (low).
+RANK_BIT = [1 << (index + 2) for index in range(12)] + [(1 << 14) | (1 << 1)]
 
-def has_straight(cards):
+RANK_BIT_ARRAY = np.array(RANK_BIT, dtype=np.int64)
+
+# Boards dealt per chunk, as in equity_simulator.run_trials.
+CHUNK_SIZE = 50_000
+
+def has_straight_batch(cards):
     """
-    Given a list of cards (each a tuple (rank, suit)), return True if the cards
-    contain any 5-card straight.
+    Given an (N, k) array of card codes, returns an (N,) bool array telling which
+    rows contain a 5-card straight.
     
-    Ace counts as high (14) and low (1).
+    Ace counts as high (14) and low (1). Each row's ranks are OR-ed into one bit mask;
+    a straight is five consecutive set bits, which survive m & m>>1 & ... & m>>4.
     """
-    rank_values = {"A": 14, "K": 13, "Q": 12, "J": 11, "T": 10,
-                   "9": 9, "8": 8, "7": 7, "6": 6, "5": 5, "4": 4, "3": 3, "2": 2}
-    values = set()
-    for card in cards:
-        r = card[0]
-        val = rank_values[r]
-        values.add(val)
-        if r == "A":  # Ace as low as well
-            values.add(1)
-    sorted_values = sorted(values)
-    consec = 1
-    for i in range(1, len(sorted_values)):
-        if sorted_values[i] == sorted_values[i - 1] + 1:
-            consec += 1
-            if consec >= 5:
-                return True
+    m = np.bitwise_or.reduce(RANK_BIT_ARRAY[cards >> 2], axis=1)
+    return (m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)) != 0
+
+@lru_cache(maxsize=None)
+def parse_hand(hand):
+    """
+    Returns the hole cards of a hand string as a tuple of two card codes, or None if
+    the string is not a valid hand.
+    """
+    # For simplicity, if offsuit, assign first card hearts, second card diamonds.
+    # If suited (last char == 's'), assign both cards the same suit.
+    if len(hand) == 3:
+        rank1, rank2, style = hand[0], hand[1], hand[2]
+        if style == 's':
+            return (card_code(rank1, "h"), card_code(rank2, "h"))
         else:
-            consec = 1
-    return False
+            return (card_code(rank1, "h"), card_code(rank2, "d"))
+    elif len(hand) == 2:
+        return (card_code(hand[0], "h"), card_code(hand[1], "d"))
+    return None
 
-def simulate_straight_probability(hand, simulations=10000):
+def simulate_straight_batch(hand, simulations=10000, rng=None):
     """
-    Simulate the probability of making a straight in Texas Hold'em given a starting hand.
+    Deal `simulations` boards to a starting hand and record whether each 7-card
+    combination (2 hole cards + 5 board) contains a straight.
     
     Parameters:
       hand (str): A hand string, e.g., "T9o", "AKo", "QJo", etc.
                   For non-pairs the format is 3 characters: first two are ranks,
                   third is 'o' for offsuit or 's' for suited.
+      simulations (int): Number of boards to deal.
+      rng (Generator): The NumPy Generator to deal with; _RNG by default.
+      
+    Returns:
+      An int8 array with one entry per board, 1 if it made a straight and 0 if not, so
+      one large batch can be split into runs afterwards. Empty for an invalid hand string.
+    """
+    hole_cards = parse_hand(hand)
+    if hole_cards is None:
+        return np.zeros(0, dtype=np.int8)
+
+    # Deal CHUNK_SIZE boards at a time: the 5 smallest of 50 uniform draws per row
+    # pick 5 distinct deck cards. float32 draws, as in equity_simulator.run_trials.
+    rng = _RNG if rng is None else rng
+    deck = np.array(build_deck(hole_cards), dtype=np.int8)
+    holes = np.array(hole_cards, dtype=np.int8)
+    hits = np.empty(simulations, dtype=np.int8)
+    for start in range(0, simulations, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, simulations)
+        rand = rng.random((stop - start, len(deck)), dtype=np.float32)
+        boards = deck[rand.argpartition(4, axis=1)[:, :5]]
+        cards = np.concatenate((np.broadcast_to(holes, (stop - start, 2)), boards), axis=1)
+        hits[start:stop] = has_straight_batch(cards)
+    return hits
+
+def simulate_straight_probability(hand, simulations=10000):
+    """
+    Simulate the probability of making a straight in Texas Hold'em given a starting hand.
+    
+    Parameters:
+      hand (str): A hand string, e.g., "T9o", "AKo", "QJo", etc. (see simulate_straight_batch).
       simulations (int): Number of simulations per run.
       
     Returns:
       The probability (float) that the 7-card combination (2 hole cards + 5 board)
       contains a straight.
     """
-    # Determine hole cards:
-    # For simplicity, if offsuit, assign first card hearts, second card diamonds.
-    # If suited (last char == 's'), assign both cards the same suit.
-    hole_cards = []
-    if len(hand) == 3:
-        rank1, rank2, style = hand[0], hand[1], hand[2]
-        if style == 's':
-            hole_cards = [(rank1, "h"), (rank2, "h")]
-        else:
-            hole_cards = [(rank1, "h"), (rank2, "d")]
-    elif len(hand) == 2:
-        hole_cards = [(hand[0], "h"), (hand[1], "d")]
-    else:
-        return 0.0
-
-    success = 0
-    deck = build_deck(hole_cards)
-    for _ in range(simulations):
-        board = random.sample(deck, 5)
-        seven_cards = hole_cards + board
-        if has_straight(seven_cards):
-            success += 1
-    return success / simulations
+    hits = simulate_straight_batch(hand, simulations)
+    return float(hits.mean()) if len(hits) else 0.0
 
+@lru_cache(maxsize=None)
 def get_gap(hand):
     """
     Compute the gap between the two hole card ranks.
@@ -101,6 +135,17 @@ def get_gap(hand):
         v1, v2 = v2, v1
     return v1 - v2
 
+def run_one_hand(hand, num_runs=25, simulations_per_run=10000):
+    """
+    Deals num_runs * simulations_per_run boards for one hand and returns
+    (hand, avg_probability, run_results).
+    """
+    hits = simulate_straight_batch(hand, simulations=num_runs * simulations_per_run,
+                                   rng=np.random.default_rng())
+    run_results = hits.reshape(num_runs, simulations_per_run).mean(axis=1).tolist()
+    avg_probability = sum(run_results) / len(run_results)
+    return hand, avg_probability, run_results
+
 # -------------------------------
 # Main Simulation and Graphing
 # -------------------------------
@@ -118,27 +163,23 @@ if __name__ == "__main__":
     results_dir = os.path.join(this_dir, "simulation_results")
     os.makedirs(results_dir, exist_ok=True)
     
-    # Loop through each test hand.
-    for hand in test_hands:
-        run_results = []
-        for run in range(num_runs):
-            prob = simulate_straight_probability(hand, simulations=simulations_per_run)
-            run_results.append(prob)
-        avg_probability = sum(run_results) / len(run_results)
-        gap = get_gap(hand)
-        results_data[hand] = {"avg_probability": avg_probability, "gap": gap, "run_results": run_results}
-        
-        # Save individual hand results to a text file.
-        output_file = os.path.join(results_dir, f"straight_results_{hand}.txt")
-        with open(output_file, "w") as f:
-            f.write(f"Straight probability results for {hand} ({num_runs} runs of {simulations_per_run} simulations each):\n\n")
-            for i, prob in enumerate(run_results, 1):
-                f.write(f"Run {i}: {prob:.4f}\n")
-            f.write("\n")
-            f.write(f"Average Probability: {avg_probability:.4f}\n")
-            f.write(f"Gap: {gap}\n")
-        
-        print(f"Results for {hand}: Average Straight Probability: {avg_probability:.4f}, Gap: {gap}")
+    one_hand = partial(run_one_hand, num_runs=num_runs, simulations_per_run=simulations_per_run)
+    with Pool(min(os.cpu_count() or 1, len(test_hands))) as pool:
+        for hand, avg_probability, run_results in pool.imap_unordered(one_hand, test_hands):
+            gap = get_gap(hand)
+            results_data[hand] = {"avg_probability": avg_probability, "gap": gap, "run_results": run_results}
+            
+            # Save individual hand results to a text file.
+            output_file = os.path.join(results_dir, f"straight_results_{hand}.txt")
+            with open(output_file, "w") as f:
+                f.write(f"Straight probability results for {hand} ({num_runs} runs of {simulations_per_run} simulations each):\n\n")
+                for i, prob in enumerate(run_results, 1):
+                    f.write(f"Run {i}: {prob:.4f}\n")
+                f.write("\n")
+                f.write(f"Average Probability: {avg_probability:.4f}\n")
+                f.write(f"Gap: {gap}\n")
+            
+            print(f"Results for {hand}: Average Straight Probability: {avg_probability:.4f}, Gap: {gap}")
     
     # -------------------------------
     # Visualization: Graph the results.